@@ -1,8 +1,9 @@
 import torch
 
 from simview.launcher import SimViewLauncher
+from simview.model import normals_from_heightmap
 from simview.scene import BodyShapeType, SimulationScene
-from simview.state import SimViewBodyState
+from simview.state import BodyTrajectory
 
 # 1. Initialize the Scene
 # We create a scene for 2 parallel simulations (batches)
@@ -20,10 +21,10 @@ heights = 0.2 * torch.sin(xx) * torch.cos(yy)
 # Add batch dimension (1, H, W) -> Shared terrain for all batches
 height_map = heights.unsqueeze(0)
 
-# Create normals (pointing roughly up for simplicity)
-# Shape: (1, 3, H, W)
-normals = torch.zeros((1, 3, resolution, resolution))
-normals[:, 2, :, :] = 1.0  # Z-up
+# Compute normals from the height gradients, with the same grid spacing the
+# viewer uses for a 10x10 extent. Shape: (1, 3, H, W)
+grid_res = 10 / resolution
+normals = normals_from_heightmap(height_map, grid_res, grid_res)
 
 scene.create_terrain(
     heightmap=height_map, normals=normals, x_lim=(-5, 5), y_lim=(-5, 5)
@@ -33,39 +34,44 @@ scene.create_terrain(
 # Define a "Box" body with dimensions 1x1x1
 scene.create_body(body_name="Box", shape_type=BodyShapeType.BOX, hx=0.5, hy=0.5, hz=0.5)
 
+
+def yaw_quaternion(angle: torch.Tensor) -> torch.Tensor:
+    """[w, x, y, z] quaternions for rotations by `angle` (radians) about Z,
+    computed for every element of `angle` at once."""
+    half = angle / 2
+    zeros = torch.zeros_like(half)
+    return torch.stack([torch.cos(half), zeros, zeros, torch.sin(half)], dim=-1)
+
+
 # 4. Add States (Animation)
-# Create a simple animation where the box moves up
-for t in range(50):
-    time = t * 0.1
-
-    # State for Batch 0: Moving up and rotating
-    pos_b0 = torch.tensor([0.0, 0.0, time * 0.5 + 1.0])  # Start above terrain
-    # Simple rotation around Z
-    angle = time * 0.5
-    quat_b0 = torch.tensor(
-        [
-            torch.cos(torch.tensor(angle / 2)),
-            0.0,
-            0.0,
-            torch.sin(torch.tensor(angle / 2)),
-        ]
-    )
-
-    # State for Batch 1: Stationary at x=2
-    pos_b1 = torch.tensor([2.0, 0.0, 1.0])
-    quat_b1 = torch.tensor([1.0, 0.0, 0.0, 0.0])
-
-    # Combine batches into a single state object
-    pos = torch.stack([pos_b0, pos_b1])
-    quat = torch.stack([quat_b0, quat_b1])
-
-    # Create Body State
-    state = SimViewBodyState("Box", pos, quat)
-
-    # Add the frame to the scene
-    scene.add_state(
-        time=time, body_states=[state], scalar_values={"energy": [10.0 - t * 0.1, 5.0]}
-    )
+# Create a simple animation where the box moves up. The whole timeline is
+# computed at once as (T, B, k) tensors and appended in a single call, rather
+# than building a SimViewBodyState per frame.
+num_steps = 50
+steps = torch.arange(num_steps, dtype=torch.float64)
+times = steps * 0.1
+zeros = torch.zeros(num_steps, dtype=torch.float64)
+ones = torch.ones(num_steps, dtype=torch.float64)
+
+# Batch 0: Moving up (starting above terrain) and rotating around Z
+pos_b0 = torch.stack([zeros, zeros, times * 0.5 + 1.0], dim=-1)  # (T, 3)
+quat_b0 = yaw_quaternion(times * 0.5)  # (T, 4)
+
+# Batch 1: Stationary at x=2
+pos_b1 = torch.tensor([2.0, 0.0, 1.0], dtype=torch.float64).expand(num_steps, 3)
+quat_b1 = torch.tensor([1.0, 0.0, 0.0, 0.0], dtype=torch.float64).expand(num_steps, 4)
+
+# Combine batches: (T, B, 3) positions and (T, B, 4) orientations
+positions = torch.stack([pos_b0, pos_b1], dim=1)
+orientations = torch.stack([quat_b0, quat_b1], dim=1)
+
+# Add all frames to the scene, with an (T, B) energy series
+energy = torch.stack([10.0 - steps * 0.1, 5.0 * ones], dim=1)
+scene.add_trajectory(
+    times,
+    trajectories=[BodyTrajectory("Box", positions, orientations)],
+    scalar_values={"energy": energy},
+)
 
 if __name__ == "__main__":
     import sys
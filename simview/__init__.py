@@ -19,7 +19,7 @@ del _version, PackageNotFoundError
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 # Public authoring API. These live in submodules that depend on the optional
-# `authoring` extra (torch, einops), so they are imported lazily: a viewing-only
+# `authoring` extra (torch, numpy), so they are imported lazily: a viewing-only
 # install can still `import simview` without those dependencies, and only pays
 # the import cost (and dependency requirement) when an authoring symbol is used.
 _LAZY_EXPORTS = {
@@ -31,6 +31,7 @@ _LAZY_EXPORTS = {
     "SimViewModel": "simview.model",
     "BodyShapeType": "simview.model",
     "OptionalBodyStateAttribute": "simview.model",
+    "normals_from_heightmap": "simview.model",
     "SimViewBodyState": "simview.state",
     "BodyTrajectory": "simview.state",
     "LiveViewer": "simview.live",
@@ -45,6 +46,7 @@ if TYPE_CHECKING:
         SimViewModel,
         SimViewStaticObject,
         SimViewTerrain,
+        normals_from_heightmap,
     )
     from simview.scene import SimulationScene, ViewerHandle
     from simview.state import BodyTrajectory, SimViewBodyState
@@ -60,6 +62,7 @@ __all__ = [
     "SimViewModel",
     "BodyShapeType",
     "OptionalBodyStateAttribute",
+    "normals_from_heightmap",
     "SimViewBodyState",
     "BodyTrajectory",
     "LiveViewer",
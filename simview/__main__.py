@@ -50,8 +50,9 @@ def clear_cache():
             logger.info("Removing %s", cache_dir)
             shutil.rmtree(cache_dir, ignore_errors=True)
 
-    # Temp scenes written by SimViewLauncher (tempfile.mkstemp with this prefix);
-    # these leak if a launched viewer is killed before cleanup runs.
+    # Temp scenes written by older SimViewLauncher versions (tempfile.mkstemp
+    # with this prefix), which leaked if a launched viewer was killed before
+    # cleanup ran. The launcher now serves scenes from memory.
     removed = 0
     for leftover in Path(tempfile.gettempdir()).glob("simview_viz_*.json"):
         try:
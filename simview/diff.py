@@ -4,7 +4,7 @@ ground truth vs. prediction, baseline vs. post-adaptation) actually track
 each other.
 
 Deliberately dependency-free (stdlib only: json, base64, struct, math) so it
-works on a base install without the `authoring` extra (torch/einops/numpy)
+works on a base install without the `authoring` extra (torch/numpy)
 -- see CLAUDE.md. Kept as its own module, independent of
 `simview/info.py`/`simview/terrain.py`, even though all three read the same
 wire format and duplicate small helpers (blob decoding) rather than sharing
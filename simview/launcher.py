@@ -56,22 +56,7 @@ class SimViewLauncher:
         """
         try:
             if self._scene is not None:
-                # Serialize the scene once and hand it to the server directly,
-                # avoiding a temp-file write + read-back round-trip.
-                logger.info("SimViewLauncher: Serving in-memory SimulationScene")
-                data = {
-                    "model": self._scene.model.to_json(),
-                    "states": self._scene.states,
-                }
-                server = SimViewServer(data=data)
-                port = find_free_port(host, preferred_port)
-                if port != preferred_port:
-                    logger.warning(
-                        "Preferred port %s is not available. Using port %s instead.",
-                        preferred_port,
-                        port,
-                    )
-                server.run(host=host, port=port)
+                self._serve_scene(host, preferred_port)
             else:
                 # __init__ guarantees exactly one of self._scene / self._sim_file_path
                 # is set (it raises otherwise), so if self._scene is None here,
@@ -90,6 +75,28 @@ class SimViewLauncher:
         finally:
             self.cleanup()
 
+    def _serve_scene(self, host: str, preferred_port: int) -> None:
+        # Serialize the scene once and hand it to the server directly,
+        # avoiding a temp-file write + read-back round-trip. Kept out of
+        # launch() so the server and its payload copies are unreferenced by
+        # the time cleanup() runs gc.collect(); the server's app/route
+        # closures form reference cycles only a collection frees.
+        assert self._scene is not None
+        logger.info("SimViewLauncher: Serving in-memory SimulationScene")
+        data = {
+            "model": self._scene.model.to_json(),
+            "states": self._scene.states,
+        }
+        server = SimViewServer(data=data)
+        port = find_free_port(host, preferred_port)
+        if port != preferred_port:
+            logger.warning(
+                "Preferred port %s is not available. Using port %s instead.",
+                preferred_port,
+                port,
+            )
+        server.run(host=host, port=port)
+
     def cleanup(self) -> None:
         """
         Clears the in-memory scene's data. Safe to call multiple times.
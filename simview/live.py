@@ -172,14 +172,13 @@ class LiveViewer:
         Runs on the caller's thread. Delegates to `scene.add_state` for the
         same validation/encoding `SimulationScene` normally does (the frame
         also lands in `self.scene.states`, so `scene.save()` still works after
-        streaming), then hands the just-appended frame to the server thread's
-        event loop for broadcast. Safe to call before any client has
-        connected -- the frame is simply buffered for the next connection's
-        catch-up message.
+        streaming, or in the file if `scene.open_stream` is active), then hands
+        the complete frame `add_state` returns to the server thread's event
+        loop for broadcast. Safe to call before any client has connected --
+        the frame is simply buffered for the next connection's catch-up
+        message.
         """
-        before = len(self.scene.states)
-        self.scene.add_state(time, body_states, scalar_values=scalar_values)
-        frame = self.scene.states[before]
+        frame = self.scene.add_state(time, body_states, scalar_values=scalar_values)
 
         self.server.frame_buffer.append(frame)
 
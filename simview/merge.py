@@ -164,18 +164,25 @@ def _validate_doc(doc: dict, label: str) -> None:
 
 
 def _expand_batched(
-    values: list | str, is_singleton: bool, batch_size: int, field: str, label: str
+    values: list | str,
+    is_singleton: bool,
+    batch_size: int,
+    field: str,
+    label: str,
+    per_batch_floats: int | None = None,
 ) -> list | str:
-    # A __b64__ blob's decoded length is always taken to span batch_size rows
-    # (see _decode_per_batch, and Terrain.js's identical convention on the
-    # viewer side) regardless of isSingleton. Singleton data is nominally a
-    # single shared entry, but the only producer that ever sets isSingleton on
-    # terrain (SimViewModel.create_terrain) already broadcasts it out to
-    # batch_size rows before encoding, so the blob is never a lone unbroadcast
-    # row that needs expanding here -- doing so would double it to
-    # batch_size^2 rows. Leave b64 blobs untouched; only plain lists (where the
-    # row count is directly observable) may need broadcasting below.
+    # A __b64__ blob's decoded length is taken to span batch_size rows (see
+    # _decode_per_batch), so a singleton terrain field stored once (the form
+    # SimViewModel.create_terrain writes: one shared row) is broadcast here by
+    # repeating its raw bytes batch_size times. Files saved before singleton
+    # terrain was stored unbroadcast already hold batch_size rows; those are
+    # recognized by their decoded length (`per_batch_floats` per row) and left
+    # untouched -- repeating them too would give batch_size^2 rows.
     if isinstance(values, str) and values.startswith("__b64__"):
+        if is_singleton and batch_size > 1 and per_batch_floats is not None:
+            raw = base64.b64decode(values[7:])
+            if len(raw) == 4 * per_batch_floats:
+                return "__b64__" + base64.b64encode(raw * batch_size).decode("utf-8")
         return values
 
     if len(values) == batch_size:
@@ -236,6 +243,21 @@ def _merge_scalar_names(models: list[dict], labels: list[str]) -> list[str]:
     return names
 
 
+def _static_shapes(entry: dict, label: str) -> list:
+    """A batched static object's per-batch shapes, expanding the
+    `uniqueShapes`/`shapeIndices` form SimViewStaticObject.to_json writes when
+    batches repeat the same shape."""
+    if "shapes" in entry:
+        return entry["shapes"]
+    try:
+        return [entry["uniqueShapes"][i] for i in entry["shapeIndices"]]
+    except (KeyError, IndexError, TypeError) as e:
+        raise ValueError(
+            f"'{label}': static object '{entry.get('name')}' has no valid "
+            f"'shapes' or 'uniqueShapes'/'shapeIndices': {e}"
+        ) from e
+
+
 def _merge_static_objects(
     models: list[dict], batch_sizes: list[int], labels: list[str]
 ) -> list[dict]:
@@ -266,7 +288,7 @@ def _merge_static_objects(
             for model, batch_size, label in zip(models, batch_sizes, labels):
                 shapes.extend(
                     _expand_batched(
-                        model["staticObjects"][idx]["shapes"],
+                        _static_shapes(model["staticObjects"][idx], label),
                         False,
                         batch_size,
                         "shapes",
@@ -334,13 +356,19 @@ def _merge_terrain(
     property_min_max: dict[str, tuple[float | None, float | None]] = {
         name: (None, None) for name in kept_properties
     }
+    cells = dims["resolutionX"] * dims["resolutionY"]
     for model, batch_size, label in zip(models, batch_sizes, labels):
         terrain = model["terrain"]
         singleton = terrain.get("isSingleton", False)
         height_data.append(
             (
                 _expand_batched(
-                    terrain["heightData"], singleton, batch_size, "heightData", label
+                    terrain["heightData"],
+                    singleton,
+                    batch_size,
+                    "heightData",
+                    label,
+                    per_batch_floats=cells,
                 ),
                 batch_size,
             )
@@ -348,7 +376,12 @@ def _merge_terrain(
         normals.append(
             (
                 _expand_batched(
-                    terrain["normals"], singleton, batch_size, "normals", label
+                    terrain["normals"],
+                    singleton,
+                    batch_size,
+                    "normals",
+                    label,
+                    per_batch_floats=cells * 3,
                 ),
                 batch_size,
             )
@@ -361,7 +394,14 @@ def _merge_terrain(
             prop = terrain["properties"][name]
             property_data[name].append(
                 (
-                    _expand_batched(prop["data"], singleton, batch_size, name, label),
+                    _expand_batched(
+                        prop["data"],
+                        singleton,
+                        batch_size,
+                        name,
+                        label,
+                        per_batch_floats=cells,
+                    ),
                     batch_size,
                 )
             )
@@ -1,12 +1,12 @@
 import base64
+import json
 import logging
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Any, cast
+from typing import Any
 
 import numpy as np
 import torch
-from einops import rearrange
 
 logger = logging.getLogger("simview.model")
 
@@ -19,7 +19,19 @@ def _encode_blob(array) -> str:
     The `__b64__` prefix marks the value so the server (and merge) can round-trip
     it as an opaque binary blob instead of verbose JSON.
     """
-    return BLOB_PREFIX + base64.b64encode(array.astype("<f4").tobytes()).decode("utf-8")
+    # ascontiguousarray only copies when it has to (wrong dtype/layout), unlike
+    # astype, so an already-float32 C-contiguous array goes straight to bytes.
+    data = np.ascontiguousarray(array, dtype="<f4")
+    return BLOB_PREFIX + base64.b64encode(data.tobytes()).decode("utf-8")
+
+
+def _tensor_to_f4(tensor: torch.Tensor) -> np.ndarray:
+    """Copy `tensor` to host memory as a float32 numpy array.
+
+    The cast happens on the tensor's own device before the device-to-host
+    copy, so e.g. a float64 CUDA tensor transfers half the bytes.
+    """
+    return tensor.detach().to(torch.float32).cpu().numpy()
 
 
 def _decode_blob(value):
@@ -33,6 +45,22 @@ def _decode_blob(value):
     return np.frombuffer(raw, dtype="<f4").tolist()
 
 
+def normals_from_heightmap(
+    heightmap: torch.Tensor, res_x: float, res_y: float
+) -> torch.Tensor:
+    """Compute unit surface normals for a heightmap.
+
+    Uses central differences (one-sided at the borders) over the last two
+    dims, so a `(Dy, Dx)` or `(B, Dy, Dx)` heightmap yields `(3, Dy, Dx)` or
+    `(B, 3, Dy, Dx)` normals, ready to pass as `create_terrain(normals=...)`.
+    `res_x`/`res_y` are the grid spacing along X and Y.
+    """
+    dzdy, dzdx = torch.gradient(heightmap, spacing=(res_y, res_x), dim=(-2, -1))
+    normals = torch.stack([-dzdx, -dzdy, torch.ones_like(dzdx)], dim=-3)
+    normals = normals / torch.linalg.norm(normals, dim=-3, keepdim=True)
+    return normals.to(dtype=heightmap.dtype)
+
+
 class BodyShapeType(StrEnum):
     POINTCLOUD = "pointcloud"
     MESH = "mesh"
@@ -49,7 +77,7 @@ class OptionalBodyStateAttribute(StrEnum):
     TORQUE = "torque"
 
 
-@dataclass
+@dataclass(slots=True)
 class TerrainProperty:
     """One arbitrary named per-cell scalar field over the terrain grid (e.g.
     friction, stiffness, or any other user-defined property), stored the same
@@ -70,7 +98,7 @@ class TerrainProperty:
         return cls(data=d["data"], min=d.get("min"), max=d.get("max"))
 
 
-@dataclass
+@dataclass(slots=True)
 class SimViewTerrain:
     extent_x: float
     extent_y: float
@@ -192,18 +220,17 @@ class SimViewTerrain:
             raise ValueError(
                 f"Normals must have 3 channels (shape[1] == 3); got shape={tuple(normals.shape)}."
             )
-        B, Dy, Dx = heightmap.shape
+        Dy, Dx = heightmap.shape[-2:]
         min_x, max_x = x_lim
         min_y, max_y = y_lim
-        min_z = heightmap.min().item()
-        max_z = heightmap.max().item()
+        # One fused pass for both bounds instead of separate min()/max() reductions.
+        min_z, max_z = (v.item() for v in heightmap.detach().aminmax())
         extent_x = max_x - min_x
         extent_y = max_y - min_y
-        height_data_list = _encode_blob(
-            rearrange(heightmap, "b d1 d2 -> b (d1 d2)").cpu().numpy()
-        )
+        height_data_list = _encode_blob(_tensor_to_f4(heightmap.flatten(start_dim=1)))
+        # (B, 3, Dy, Dx) channels-first -> (B, Dy*Dx, 3), one XYZ per cell.
         normals_list = _encode_blob(
-            rearrange(normals, "b c d1 d2 -> b (d1 d2) c").cpu().numpy()
+            _tensor_to_f4(normals.permute(0, 2, 3, 1).flatten(start_dim=1, end_dim=2))
         )
 
         properties_out: dict[str, TerrainProperty] = {}
@@ -213,12 +240,11 @@ class SimViewTerrain:
                     f"Property '{name}' map must include a batch dimension "
                     f"(ndim=3); got ndim={prop_map.ndim}."
                 )
+            prop_min, prop_max = (v.item() for v in prop_map.detach().aminmax())
             properties_out[name] = TerrainProperty(
-                data=_encode_blob(
-                    rearrange(prop_map, "b d1 d2 -> b (d1 d2)").cpu().numpy()
-                ),
-                min=prop_map.min().item(),
-                max=prop_map.max().item(),
+                data=_encode_blob(_tensor_to_f4(prop_map.flatten(start_dim=1))),
+                min=prop_min,
+                max=prop_max,
             )
 
         embedding_data_list = None
@@ -228,7 +254,9 @@ class SimViewTerrain:
                     f"Embedding map must include a batch dimension (ndim=4); got ndim={embedding_map.ndim}."
                 )
             embedding_data_list = _encode_blob(
-                rearrange(embedding_map, "b k d1 d2 -> b (d1 d2) k").cpu().numpy()
+                _tensor_to_f4(
+                    embedding_map.permute(0, 2, 3, 1).flatten(start_dim=1, end_dim=2)
+                )
             )
 
         return SimViewTerrain(
@@ -250,7 +278,7 @@ class SimViewTerrain:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SimViewBody:
     name: str
     shape: dict
@@ -293,16 +321,30 @@ class SimViewBody:
 
     @staticmethod
     def _create_shape_dict(body_type: BodyShapeType, **kwargs) -> dict:
-        """Helper to create the shape dictionary, converting tensors."""
+        """Helper to create the shape dictionary, converting tensors.
+
+        Array-valued fields (tensors or numpy arrays, e.g. mesh vertices/faces or
+        point-cloud points) are packed straight into ``__b64__`` blobs, never
+        materialized as Python lists; single-element values (e.g. a box's
+        ``hx`` given as a 0-d tensor or a numpy scalar) become Python scalars.
+        """
         shape_dict: dict[str, Any] = {"type": body_type.value}
         for key, value in kwargs.items():
-            if isinstance(value, torch.Tensor):
-                if value.numel() > 1:
-                    shape_dict[key] = _encode_blob(value.cpu().numpy())
-                else:
-                    shape_dict[key] = value.item()
-            else:
+            if isinstance(value, (int, float, str)):
+                # The usual case for primitive shapes' dimensions.
                 shape_dict[key] = value
+            elif isinstance(value, torch.Tensor) and value.numel() == 1:
+                shape_dict[key] = value.item()
+            else:
+                if isinstance(value, torch.Tensor):
+                    value = value.detach().cpu().numpy()
+                if isinstance(value, (np.ndarray, np.generic)):
+                    if value.size > 1:
+                        shape_dict[key] = _encode_blob(value)
+                    else:
+                        shape_dict[key] = value.item()
+                else:
+                    shape_dict[key] = value
         return shape_dict
 
     @staticmethod
@@ -425,7 +467,7 @@ class SimViewBody:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SimViewStaticObject:
     name: str
     is_singleton: bool
@@ -487,7 +529,15 @@ class SimViewStaticObject:
         if self.is_singleton:
             r["shape"] = self.shape
         else:
-            r["shapes"] = self.shapes
+            assert self.shapes is not None
+            unique, indices = _dedupe_shapes(self.shapes)
+            if len(unique) < len(self.shapes):
+                # Repeated shapes (e.g. the same box in every batch) are
+                # written once, with a per-batch index into them.
+                r["uniqueShapes"] = unique
+                r["shapeIndices"] = indices
+            else:
+                r["shapes"] = self.shapes
         return r
 
     @classmethod
@@ -498,14 +548,46 @@ class SimViewStaticObject:
             is_singleton = d["isSingleton"]
         except KeyError as e:
             raise ValueError(f"Static object dict is missing required key: {e}") from e
+        shapes = d.get("shapes")
+        if shapes is None and "shapeIndices" in d:
+            unique = d.get("uniqueShapes") or []
+            try:
+                shapes = [unique[i] for i in d["shapeIndices"]]
+            except (IndexError, TypeError) as e:
+                raise ValueError(
+                    f"Static object '{name}' has an invalid shapeIndices entry: {e}"
+                ) from e
         return cls(
             name=name,
             is_singleton=is_singleton,
             shape=d.get("shape"),
-            shapes=d.get("shapes"),
+            shapes=shapes,
         )
 
 
+def _dedupe_shapes(shapes: list[dict]) -> tuple[list[dict], list[int]]:
+    """Split `shapes` into its distinct shape dicts (in first-seen order) and,
+    per entry, the index of its shape among them.
+
+    Shapes are keyed by their exact JSON text. If any shape isn't plain JSON
+    (e.g. it holds a numpy array, whose repr is truncated and so can't tell
+    two arrays apart), every entry is kept as its own shape.
+    """
+    unique: list[dict] = []
+    seen: dict[str, int] = {}
+    indices = []
+    for shape in shapes:
+        try:
+            key = json.dumps(shape, sort_keys=True)
+        except TypeError:
+            return list(shapes), list(range(len(shapes)))
+        if key not in seen:
+            seen[key] = len(unique)
+            unique.append(shape)
+        indices.append(seen[key])
+    return unique, indices
+
+
 def _validate_parent_ref(name: str, parent: str | None, known_bodies: dict) -> None:
     """Raise ValueError if `parent` is self-referential or isn't already in
     `known_bodies`. Requiring the parent to already be known (rather than doing
@@ -523,7 +605,7 @@ def _validate_parent_ref(name: str, parent: str | None, known_bodies: dict) -> N
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SimViewModel:
     batch_size: int
     scalar_names: list[str]
@@ -570,6 +652,7 @@ class SimViewModel:
                 )
         self.static_objects[static_object.name] = static_object
 
+    @torch.inference_mode()
     def create_terrain(
         self,
         heightmap: torch.Tensor,
@@ -613,15 +696,7 @@ class SimViewModel:
             H_dim, W_dim = heightmap.shape[-2:]
             res_x = (x_lim[1] - x_lim[0]) / W_dim
             res_y = (y_lim[1] - y_lim[0]) / H_dim
-            dzdy, dzdx = torch.gradient(heightmap, spacing=(res_y, res_x), dim=(-2, -1))
-            nx = -dzdx
-            ny = -dzdy
-            nz = torch.ones_like(nx)
-            computed_normals = torch.stack([nx, ny, nz], dim=-3)
-            computed_normals = computed_normals / torch.linalg.norm(
-                computed_normals, dim=-3, keepdim=True
-            )
-            normals = cast(torch.Tensor, computed_normals.to(dtype=heightmap.dtype))
+            normals = normals_from_heightmap(heightmap, res_x, res_y)
 
         if normals.ndim == 3:  # channels first
             normals = normals.unsqueeze(0)  # add batch dim
@@ -655,9 +730,11 @@ class SimViewModel:
             tensor.shape[0] == 1 for tensor in provided.values() if tensor is not None
         )
 
-        # The viewer always splits terrain data into batch_size chunks, so broadcast
-        # any shared field up to the full batch size before encoding.
-        if self.batch_size > 1:
+        # A singleton terrain is stored once (batch dim 1) and broadcast by its
+        # consumers (viewer, merge, terrain CLI), instead of encoding batch_size
+        # identical copies. Only the mixed case -- some fields shared, others
+        # per-batch -- needs the shared fields expanded to the full batch size.
+        if self.batch_size > 1 and not is_singleton:
             if heightmap.shape[0] == 1:
                 heightmap = heightmap.repeat(self.batch_size, 1, 1)
             if normals.shape[0] == 1:
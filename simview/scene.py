@@ -1,12 +1,19 @@
 import gzip
 import json
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, cast
 
 import numpy as np
 import torch
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .model import (
     BodyShapeType,  # If used directly by users of SimulationData for body creation
     OptionalBodyStateAttribute,  # If used directly
@@ -15,6 +22,7 @@ from .model import (
     SimViewStaticObject,
     SimViewTerrain,
     _encode_blob,
+    _tensor_to_f4,
 )
 from .server import SimViewServer
 from .state import (
@@ -22,11 +30,78 @@ from .state import (
     BodyTrajectory,
     LocalTransformLike,
     SimViewBodyState,
+    _stack_host,
 )
 from .utils import read_maybe_gzipped_bytes
 
 logger = logging.getLogger("simview.scene")
 
+# Write buffer for SimulationScene.save. 1 MiB keeps write() calls rare even
+# for scenes with thousands of small per-state chunks.
+_SAVE_BUFFER_SIZE = 1 << 20
+
+if orjson is not None:
+    # OPT_SERIALIZE_NUMPY lets numpy arrays/scalars (e.g. in metadata) go
+    # straight through the C encoder; OPT_NON_STR_KEYS matches json.dump's
+    # stringification of int/float dict keys.
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    # Bound here so the None-narrowing above carries into _dumps for pyright.
+    _orjson = orjson
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        option = _ORJSON_OPTIONS | (_orjson.OPT_INDENT_2 if indent else 0)
+        return _orjson.dumps(obj, option=option)
+
+else:
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _collect_provided_attrs(state: dict, into: dict[str, set[str]]) -> None:
+    """Add each body's optional attributes present in `state` to `into`."""
+    for body_data in state.get("bodies", []):
+        name = body_data.get("name")
+        if name:
+            # Everything in the body's dict other than name and bodyTransform is an optional attribute
+            provided = set(body_data.keys()) - {"name", "bodyTransform"}
+            for n in _iter_names(name):
+                into.setdefault(n, set()).update(provided)
+
+
+def _resolve_output_path(filepath: str | Path, compress: bool) -> tuple[Path, bool]:
+    """The path a scene is written to and whether it's gzipped: a ``.gz``
+    suffix implies `compress`, and `compress` appends one if missing."""
+    output_path = Path(filepath)
+    if compress and output_path.suffix != ".gz":
+        output_path = output_path.with_name(output_path.name + ".gz")
+    compress = compress or output_path.suffix == ".gz"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return output_path, compress
+
+
+def _open_output(output_path: Path, compress: bool) -> IO[bytes]:
+    if compress:
+        return cast(IO[bytes], gzip.open(output_path, "wb"))
+    return open(output_path, "wb", buffering=_SAVE_BUFFER_SIZE)
+
+
+class _StateStream:
+    """A scene file being written by `SimulationScene.open_stream`: each frame
+    is appended as it's recorded, and the body attributes seen are tracked so
+    the model can be reconciled when the stream closes."""
+
+    def __init__(self, f: IO[bytes]) -> None:
+        self.f = f
+        self.count = 0
+        self.provided_attrs: dict[str, set[str]] = {}
+
+    def write(self, state: dict) -> None:
+        _collect_provided_attrs(state, self.provided_attrs)
+        self.f.write(b",\n    " if self.count else b"    ")
+        self.f.write(_dumps(state))
+        self.count += 1
+
 
 class ViewerHandle:
     """A running, non-blocking SimView server for a snapshot of a scene.
@@ -68,7 +143,7 @@ class ViewerHandle:
 def _to_f4(value) -> np.ndarray:
     """Coerce a tensor / array / nested list to a contiguous little-endian float32 array."""
     if isinstance(value, torch.Tensor):
-        value = value.detach().cpu().numpy()
+        value = _tensor_to_f4(value)
     return np.ascontiguousarray(np.asarray(value, dtype="<f4"))
 
 
@@ -154,6 +229,21 @@ def _as_tb(value, T: int, B: int, name: str) -> np.ndarray:
     return arr
 
 
+def _scalars_tolist(arrays: dict[str, Any]) -> dict[str, list]:
+    """Convert one frame's tensor/array scalar values to lists.
+
+    Device tensors that line up are stacked and copied to the host together,
+    one sync per frame instead of one per scalar; CPU values are converted
+    directly, which is cheaper than stacking them.
+    """
+    values = list(arrays.values())
+    if any(isinstance(v, torch.Tensor) and v.device.type != "cpu" for v in values):
+        stacked = _stack_host(values)
+        if stacked is not None:
+            return dict(zip(arrays, stacked.tolist()))
+    return {k: v.tolist() for k, v in arrays.items()}
+
+
 class SimulationScene:
     def __init__(
         self,
@@ -188,7 +278,13 @@ class SimulationScene:
             batch_names=batch_names,
             metadata=metadata,
         )
+        # Scalar names as a set (for validating each add_state call's keys
+        # without building sets per frame) and in model order.
+        self._scalar_name_set = frozenset(scalar_names)
+        self._scalar_names = tuple(scalar_names)
         self.states: list[dict] = []
+        # Set while `open_stream` is active: frames go to it instead of `states`.
+        self._stream: _StateStream | None = None
 
     @classmethod
     def from_dict(cls, d: dict) -> "SimulationScene":
@@ -237,35 +333,44 @@ class SimulationScene:
         time: float,
         body_states: list[SimViewBodyState],
         scalar_values: dict[str, torch.Tensor | np.ndarray | list] | None = None,
-    ) -> None:
+    ) -> dict:
         """
         Adds a new state (snapshot in time) to the simulation data.
+
+        Returns the recorded frame dict, complete with its scalar values, as
+        it will be saved. Inside `open_stream` it is written to the file
+        instead of kept in `states`.
         """
         for state in body_states:
             _validate_body_name(state.body_name, self.model)
             _validate_not_rigid(state.body_name, self.model)
 
-        if self.model.scalar_names:
+        if self._scalar_names:
             if scalar_values is None:
                 raise ValueError(
                     "Scalar values must be provided when scalar_names are defined in the model."
                 )
-            if set(scalar_values.keys()) != set(self.model.scalar_names):
+            if scalar_values.keys() != self._scalar_name_set:
                 raise ValueError(
                     "Provided scalar_values keys do not match scalar_names in the model."
                 )
 
-            processed_scalars = {}
-            for k, v in scalar_values.items():
+            # Tensors/arrays become fresh lists right away, so a caller
+            # reusing one buffer across frames can't change earlier frames.
+            list_scalars = {}
+            array_scalars = {}
+            for k in self._scalar_names:
+                v = scalar_values[k]
                 if isinstance(v, (torch.Tensor, np.ndarray)):
-                    processed_scalars[k] = v.tolist()
+                    array_scalars[k] = v
                 elif isinstance(v, list):
-                    processed_scalars[k] = v
+                    list_scalars[k] = v
                 else:
                     raise TypeError(
                         f"Scalar value for '{k}' must be a torch.Tensor, "
                         "numpy.ndarray, or a list."
                     )
+            processed_scalars = {**list_scalars, **_scalars_tolist(array_scalars)}
         else:
             processed_scalars = {}
             if scalar_values:
@@ -274,13 +379,16 @@ class SimulationScene:
                     "model. These values will be ignored."
                 )
 
-        self.states.append(
-            {
-                "time": time,
-                "bodies": [state.to_json() for state in body_states],
-                **processed_scalars,
-            }
-        )
+        frame = {
+            "time": time,
+            "bodies": [state.to_json() for state in body_states],
+            **processed_scalars,
+        }
+        if self._stream is not None:
+            self._stream.write(frame)
+        else:
+            self.states.append(frame)
+        return frame
 
     def add_trajectory(
         self,
@@ -320,16 +428,14 @@ class SimulationScene:
         T = len(times)
         B = self.model.batch_size
 
-        if self.model.scalar_names:
-            if scalar_values is None or set(scalar_values) != set(
-                self.model.scalar_names
-            ):
+        if self._scalar_names:
+            if scalar_values is None or scalar_values.keys() != self._scalar_name_set:
                 raise ValueError(
                     "scalar_values keys must match the model's scalar_names."
                 )
             scalars = {
                 name: _as_tb(scalar_values[name], T, B, name)
-                for name in self.model.scalar_names
+                for name in self._scalar_names
             }
         else:
             if scalar_values:
@@ -399,7 +505,10 @@ class SimulationScene:
             state = {"time": times[t], "bodies": bodies}
             for name, arr in scalars.items():
                 state[name] = arr[t].tolist()
-            self.states.append(state)
+            if self._stream is not None:
+                self._stream.write(state)
+            else:
+                self.states.append(state)
 
     def save(self, filepath: str | Path, compress: bool = False) -> None:
         """
@@ -422,54 +531,90 @@ class SimulationScene:
         # Reconcile available_attributes with actual data across all states
         # (an attribute may be absent from earlier frames but present later)
         if self.states:
-            provided_attrs_by_body = {}
+            provided_attrs_by_body: dict[str, set[str]] = {}
             for state in self.states:
-                for body_data in state.get("bodies", []):
-                    name = body_data.get("name")
-                    if name:
-                        # Everything in the body's dict other than name and bodyTransform is an optional attribute
-                        provided = set(body_data.keys()) - {"name", "bodyTransform"}
-                        for n in _iter_names(name):
-                            provided_attrs_by_body.setdefault(n, set()).update(provided)
-
-            for name, body in self.model.bodies.items():
-                if name in provided_attrs_by_body:
-                    provided = provided_attrs_by_body[name]
-                    if provided:
-                        body.available_attributes = [
-                            OptionalBodyStateAttribute(k) for k in provided
-                        ]
-                    else:
-                        body.available_attributes = None
-
-        output_path = Path(filepath)
-        if compress and output_path.suffix != ".gz":
-            output_path = output_path.with_name(output_path.name + ".gz")
-        compress = compress or output_path.suffix == ".gz"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+                _collect_provided_attrs(state, provided_attrs_by_body)
+            self._reconcile_available_attributes(provided_attrs_by_body)
+
+        output_path, compress = _resolve_output_path(filepath, compress)
 
         try:
             logger.info("Saving simulation data to %s...", output_path)
-            open_fn = (
-                (lambda p: gzip.open(p, "wt")) if compress else (lambda p: open(p, "w"))
-            )
-            with open_fn(output_path) as f:
-                f.write("{\n")
-                f.write('  "model": ')
-                json.dump(self.model.to_json(), f, indent=2)
-                f.write(",\n")
-                f.write('  "states": [\n')
+            with _open_output(output_path, compress) as f:
+                f.write(b"{\n")
+                f.write(b'  "model": ')
+                f.write(_dumps(self.model.to_json(), indent=True))
+                f.write(b",\n")
+                f.write(b'  "states": [\n')
                 for i, state in enumerate(self.states):
                     if i > 0:
-                        f.write(",\n")
-                    f.write("    ")
-                    json.dump(state, f)
-                f.write("\n  ]\n}")
+                        f.write(b",\n")
+                    f.write(b"    ")
+                    f.write(_dumps(state))
+                f.write(b"\n  ]\n}")
             logger.info("Simulation data successfully saved to %s", output_path)
         except Exception:
             logger.exception("Error saving simulation data to %s", output_path)
             raise
 
+    @contextmanager
+    def open_stream(
+        self, filepath: str | Path, compress: bool = False
+    ) -> Iterator[Path]:
+        """Write frames straight to a scene file as they are added, instead of
+        holding them all in memory until `save`.
+
+        Inside the ``with`` block every `add_state`/`add_trajectory` frame is
+        serialized to `filepath` immediately and not kept in `states`, so memory
+        stays flat however long the run. Frames already in `states` are written
+        first and dropped. The model (with available attributes reconciled
+        across every streamed frame, as `save` does) is written on exit, after
+        the states, so the result is an ordinary scene file for `load`, the
+        viewer and the CLI. The file is finalized even if the block raises, so
+        a crashed run still leaves every frame recorded so far loadable.
+
+        ``filepath``/``compress`` behave as in `save`. Yields the output path.
+        """
+        if self._stream is not None:
+            raise RuntimeError("A stream is already open for this scene.")
+        if not self.model.is_complete:
+            raise ValueError(
+                "Cannot stream data: The simulation model is not complete (e.g., terrain might be missing)."
+            )
+        output_path, compress = _resolve_output_path(filepath, compress)
+
+        logger.info("Streaming simulation data to %s...", output_path)
+        with _open_output(output_path, compress) as f:
+            stream = _StateStream(f)
+            f.write(b'{\n  "states": [\n')
+            for state in self.states:
+                stream.write(state)
+            self.states = []
+            self._stream = stream
+            try:
+                yield output_path
+            finally:
+                self._stream = None
+                self._reconcile_available_attributes(stream.provided_attrs)
+                f.write(b"\n  ],\n")
+                f.write(b'  "model": ')
+                f.write(_dumps(self.model.to_json(), indent=True))
+                f.write(b"\n}")
+        logger.info("Streamed %d states to %s", stream.count, output_path)
+
+    def _reconcile_available_attributes(
+        self, provided_attrs_by_body: dict[str, set[str]]
+    ) -> None:
+        for name, body in self.model.bodies.items():
+            if name in provided_attrs_by_body:
+                provided = provided_attrs_by_body[name]
+                if provided:
+                    body.available_attributes = [
+                        OptionalBodyStateAttribute(k) for k in provided
+                    ]
+                else:
+                    body.available_attributes = None
+
     def show(
         self,
         host: str = "127.0.0.1",
@@ -4,6 +4,8 @@ import gzip
 import hashlib
 import json
 import logging
+import mmap
+import os
 import secrets
 import time
 from collections.abc import Sequence
@@ -25,12 +27,13 @@ from importlib.resources import files
 import uvicorn
 from fastapi import FastAPI, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from starlette.types import Scope
 
-from simview.utils import find_free_port, read_maybe_gzipped_bytes
+from simview.utils import find_free_port, is_gzipped, read_maybe_gzipped_bytes
 
 logger = logging.getLogger("simview.server")
 
@@ -49,6 +52,10 @@ _ALLOWED_ORIGIN_REGEX = r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$"
 # a short revalidation window.
 _IMMUTABLE_STATIC_DIRS = ("lib/",)
 
+# Upper bound on distinct base URLs (host:port as the client addressed us)
+# whose rendered index.html is kept; a local viewer sees one or two.
+_MAX_CACHED_INDEX_PAGES = 8
+
 # Per-body numeric state fields eligible for columnar (whole-trajectory) binary
 # packing, with their trailing per-batch-row width. Same fields/widths
 # SimViewBodyState/add_trajectory may binary-encode per frame (state.py,
@@ -63,6 +70,34 @@ _STATE_FIELD_WIDTHS = {
 }
 
 
+def _load_scene_json(path: Path):
+    """Parse the scene file at `path`, which may be gzip-compressed.
+
+    With orjson, an uncompressed file is parsed straight from a read-only
+    mmap, so a multi-hundred-MB scene is never also copied into one big
+    Python bytes object first. Gzipped (or empty) files, and the stdlib json
+    fallback, go through read_maybe_gzipped_bytes as before.
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            if not is_gzipped(f) and os.fstat(f.fileno()).st_size:
+                with (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                    memoryview(mm) as view,
+                ):
+                    return orjson.loads(view)
+    raw = read_maybe_gzipped_bytes(path)
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _dumps_text(obj) -> str:
+    """Serialize a /ws/states message to text. orjson when available (much
+    faster on the long float lists in state frames), stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
 class _StatesShapeMismatch(Exception):
     """Raised internally by _columnarize_states to bail out to the legacy
     array response -- caught in one place rather than threading a bunch of
@@ -413,8 +448,7 @@ class SimViewServer:
             # provided and is guaranteed non-None.
             assert self.sim_path is not None
             logger.info("Loading simulation data from %s...", self.sim_path)
-            raw = read_maybe_gzipped_bytes(self.sim_path)
-            data = orjson.loads(raw) if orjson else json.loads(raw)
+            data = _load_scene_json(self.sim_path)
 
         model_data = data.get("model")
         states_data = data.get("states")
@@ -451,22 +485,30 @@ class SimViewServer:
         # same port gets a different token, so it can never collide with a
         # stale cached response for blob id N from a previous load.
         self._blob_token = secrets.token_hex(4)
+        # Blob id by content, so byte-identical blobs (e.g. a body that never
+        # moves, or the same shape reused across bodies) are stored and served
+        # once under a single URL. Keyed by the bytes themselves rather than a
+        # digest: exact, and bytes caches its own hash.
+        blob_ids: dict[bytes, int] = {}
+
+        def register_blob(raw: bytes) -> str:
+            blob_id = blob_ids.get(raw)
+            if blob_id is None:
+                blob_id = blob_ids[raw] = len(self.blobs)
+                self.blobs.append(raw)
+            return f"/blob/{self._blob_token}/{blob_id}"
 
         def extract_blobs(obj):
             if isinstance(obj, dict):
                 for k, v in obj.items():
                     if isinstance(v, str) and v.startswith("__b64__"):
-                        blob_id = len(self.blobs)
-                        self.blobs.append(base64.b64decode(v[7:]))
-                        obj[k] = f"/blob/{self._blob_token}/{blob_id}"
+                        obj[k] = register_blob(base64.b64decode(v[7:]))
                     else:
                         extract_blobs(v)
             elif isinstance(obj, list):
                 for i, v in enumerate(obj):
                     if isinstance(v, str) and v.startswith("__b64__"):
-                        blob_id = len(self.blobs)
-                        self.blobs.append(base64.b64decode(v[7:]))
-                        obj[i] = f"/blob/{self._blob_token}/{blob_id}"
+                        obj[i] = register_blob(base64.b64decode(v[7:]))
                     else:
                         extract_blobs(v)
 
@@ -475,11 +517,6 @@ class SimViewServer:
         if self.model_data is not None:
             extract_blobs(self.model_data)
 
-        def register_blob(raw: bytes) -> str:
-            blob_id = len(self.blobs)
-            self.blobs.append(raw)
-            return f"/blob/{self._blob_token}/{blob_id}"
-
         # Repack the per-frame states array into whole-trajectory columnar
         # blobs (wire format v4, see README "Binary state fields") so the
         # viewer parses one lightweight JSON index plus raw binary instead of
@@ -514,13 +551,27 @@ class SimViewServer:
         logger.info("Simulation data loaded successfully.")
 
     def setup_routes(self):
+        # index.html only varies with the base URL its url_for() links are
+        # built from, so render it once per base URL instead of per request.
+        # The ?v= cache-buster is fixed per server start: the bundled JS
+        # can't change while this process is serving it.
+        index_version = int(time.time())
+        index_pages: dict[str, bytes] = {}
+
         @self.app.get("/")
         async def index(request: Request):
-            return self.templates.TemplateResponse(
-                request=request,
-                name="index.html",
-                context={"request": request, "t": int(time.time())},
-            )
+            key = str(request.base_url)
+            page = index_pages.get(key)
+            if page is None:
+                page = self.templates.TemplateResponse(
+                    request=request,
+                    name="index.html",
+                    context={"request": request, "t": index_version},
+                ).body
+                # Bounded: the Host header is client-controlled.
+                if len(index_pages) < _MAX_CACHED_INDEX_PAGES:
+                    index_pages[key] = page
+            return HTMLResponse(page)
 
         _gzip_headers = {"Content-Encoding": "gzip"}
 
@@ -614,7 +665,7 @@ class SimViewServer:
                 try:
                     if self.frame_buffer:
                         await websocket.send_text(
-                            json.dumps({"states": list(self.frame_buffer)})
+                            _dumps_text({"states": list(self.frame_buffer)})
                         )
                     while True:
                         # This endpoint is push-only; block here until the
@@ -637,7 +688,7 @@ class SimViewServer:
         """
         if not self.ws_clients:
             return
-        message = json.dumps({"states": [frame]})
+        message = _dumps_text({"states": [frame]})
         dead = []
         for client in self.ws_clients:
             try:
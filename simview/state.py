@@ -11,8 +11,8 @@ from simview.model import OptionalBodyStateAttribute, _encode_blob
 ArrayLike = torch.Tensor | np.ndarray
 
 # Accepted input types for a body's constant `local_transform`: unlike the
-# ArrayLike-typed per-frame pose/vector fields above (which call `.tolist()`
-# unconditionally and so require an actual tensor/ndarray), `local_transform`
+# ArrayLike-typed per-frame pose/vector fields above (which are converted to
+# numpy arrays and so require an actual tensor/ndarray), `local_transform`
 # is only ever normalized via `hasattr(..., "tolist")` + `list(...)` (see
 # SimViewBody.create), so a plain sequence of floats works too and callers
 # shouldn't need numpy/torch just to pass a constant 7-element offset.
@@ -33,6 +33,70 @@ TRAJECTORY_VECTOR_FIELDS = {
 # always stay plain JSON.
 _BINARY_ELIGIBLE_FIELDS = {"bodyTransform", *TRAJECTORY_VECTOR_FIELDS.values()}
 
+# Valid optional attribute keys, checked once per attribute per state. The
+# enum is a StrEnum, so its members hash/compare equal to these strings and
+# either form can be looked up directly.
+_OPTIONAL_ATTRIBUTE_KEYS = frozenset(a.value for a in OptionalBodyStateAttribute)
+_CONTACTS_KEY = OptionalBodyStateAttribute.CONTACTS.value
+
+# Float dtypes numpy can represent; others (bfloat16, float8) are upcast to
+# float32 before the host copy, as `.tolist()` would have accepted them.
+_NUMPY_FLOAT_DTYPES = frozenset({torch.float16, torch.float32, torch.float64})
+
+
+def _host_array(value: ArrayLike, copy: bool = False) -> np.ndarray:
+    """View a tensor/array as a host numpy array without building Python floats.
+
+    Keeps the caller's dtype (a float64 pose stays float64 for ``binary=False``
+    output); the float32 cast for blobs happens later in ``_encode_blob``.
+    With ``copy=True`` the result never shares memory with the caller's
+    buffer, so later in-place updates to it don't leak into a stored state.
+    """
+    if isinstance(value, torch.Tensor):
+        value = value.detach()
+        if value.dtype.is_floating_point and value.dtype not in _NUMPY_FLOAT_DTYPES:
+            value = value.float()
+        array = value.cpu().numpy()
+    else:
+        array = np.asarray(value)
+    return np.array(array, copy=True) if copy else array
+
+
+def _stack_host(values: list) -> np.ndarray | None:
+    """Stack a list of per-batch/per-frame tensors/arrays into one host array.
+
+    Same-shaped, same-dtype values are stacked in a single call (one
+    device-to-host copy for tensors). Returns ``None`` for an empty or
+    heterogeneous list; callers then convert each value on its own.
+    """
+    if not values:
+        return None
+    first = values[0]
+    if all(
+        isinstance(v, torch.Tensor)
+        and v.shape == first.shape
+        and v.dtype == first.dtype
+        and v.device == first.device
+        for v in values
+    ):
+        return _host_array(torch.stack(values))
+    if all(
+        isinstance(v, np.ndarray) and v.shape == first.shape and v.dtype == first.dtype
+        for v in values
+    ):
+        return np.stack(values)
+    return None
+
+
+def _split_rows(cols: list[int], counts: list[int]) -> list[list[int]]:
+    """Split row-major nonzero column indices into one list per mask row."""
+    rows = []
+    start = 0
+    for count in counts:
+        rows.append(cols[start : start + count])
+        start += count
+    return rows
+
 
 @dataclass
 class BodyTrajectory:
@@ -98,35 +162,92 @@ class SimViewBodyState:
         the viewer and :func:`merge_simulation_files` decode these
         transparently. Set ``binary=False`` to emit plain JSON lists."""
         self.body_name = body_name
-        self.position = position.tolist()
-        self.orientation = orientation.tolist()
+        # Fused once into the wire layout [x, y, z, w, qx, qy, qz] (per batch
+        # row, if batched); position/orientation are views into it.
+        self.body_transform = np.concatenate(
+            [_host_array(position), _host_array(orientation)], axis=-1
+        )
+        self.position = self.body_transform[..., :3]
+        self.orientation = self.body_transform[..., 3:]
         self.binary = binary
         self._set_optional_attributes(optional_attributes or {})
 
+    @classmethod
+    def from_frame(
+        cls,
+        body_names: Sequence[str | list[str]],
+        positions: ArrayLike,
+        orientations: ArrayLike,
+        optional_attributes: dict | None = None,
+        binary: bool = True,
+    ) -> list["SimViewBodyState"]:
+        """Build one state per body from whole-frame stacked arrays.
+
+        ``positions`` is ``(N, B, 3)`` (or ``(N, 3)`` for a single batch) and
+        ``orientations`` ``(N, B, 4)``, with row ``i`` belonging to
+        ``body_names[i]``; each ``optional_attributes`` value is stacked the
+        same way along its first dimension. Every array is copied to the host
+        once, so a CUDA-resident frame costs one device-to-host sync per field
+        instead of one per body. The result can be passed straight to
+        ``SimulationScene.add_state``."""
+        n = len(body_names)
+        arrays = {
+            "positions": _host_array(positions),
+            "orientations": _host_array(orientations),
+            **{
+                key: _host_array(value)
+                for key, value in (optional_attributes or {}).items()
+            },
+        }
+        for key, array in arrays.items():
+            if array.ndim == 0 or len(array) != n:
+                raise ValueError(
+                    f"from_frame: '{key}' must have a leading dimension of "
+                    f"{n} (one row per body), got shape {array.shape}"
+                )
+        positions_np = arrays.pop("positions")
+        orientations_np = arrays.pop("orientations")
+        return [
+            cls(
+                name,
+                positions_np[i],
+                orientations_np[i],
+                {key: array[i] for key, array in arrays.items()} or None,
+                binary=binary,
+            )
+            for i, name in enumerate(body_names)
+        ]
+
     def __repr__(self) -> str:
         return f"SimViewBodyState(name={self.body_name}, position={self.position}, orientation={self.orientation}, optional_attrs={self.optional_attrs})"
 
     def _set_optional_attributes(self, attrs):
         self.optional_attrs = {}
         for key, value in attrs.items():
-            try:
-                key = OptionalBodyStateAttribute(key)
-            except ValueError:
+            if key not in _OPTIONAL_ATTRIBUTE_KEYS:
                 raise ValueError(f"Unknown optional attribute: {key}")
-            if key == OptionalBodyStateAttribute.CONTACTS:
+            # str() turns an OptionalBodyStateAttribute member into its plain
+            # wire key, so optional_attrs keys stay ordinary strings.
+            key = str(key)
+            if key == _CONTACTS_KEY:
                 value = self._process_contacts(value)
             elif isinstance(value, (torch.Tensor, np.ndarray)):
-                value = value.tolist()
+                # Copied, like add_state's scalars: a caller updating one
+                # buffer in place each step must not rewrite earlier states.
+                value = _host_array(value, copy=True)
             elif isinstance(value, list):
                 if all(isinstance(v, (torch.Tensor, np.ndarray)) for v in value):
-                    value = [v.tolist() for v in value]
+                    stacked = _stack_host(value)
+                    value = (
+                        stacked if stacked is not None else [v.tolist() for v in value]
+                    )
                 elif all(isinstance(v, list) for v in value):
                     pass
                 else:
                     raise ValueError("Unknown list format")
             else:
                 raise ValueError(f"Unknown attribute type for {key}: {type(value)}")
-            self.optional_attrs[key.value] = value
+            self.optional_attrs[key] = value
 
     @staticmethod
     def _process_contacts(contacts: ArrayLike | list):
@@ -138,6 +259,12 @@ class SimViewBodyState:
                 is_complex = dtype.is_complex
                 if is_bool or is_float:
                     # Boolean mask (floats treated as a mask of non-zero entries)
+                    if contacts.dim() == 2:
+                        # One nonzero over the whole (B, N) mask instead of
+                        # one per batch row; columns come back row-major.
+                        cols = torch.nonzero(contacts, as_tuple=True)[1]
+                        counts = torch.count_nonzero(contacts, dim=1)
+                        return _split_rows(cols.tolist(), counts.tolist())
                     return [
                         torch.nonzero(c, as_tuple=True)[0].tolist() for c in contacts
                     ]
@@ -152,6 +279,10 @@ class SimViewBodyState:
                 is_complex = np.issubdtype(np_dtype, np.complexfloating)
                 if is_bool or is_float:
                     # Boolean mask (floats treated as a mask of non-zero entries)
+                    if contacts.ndim == 2:
+                        cols = np.nonzero(contacts)[1]
+                        counts = np.count_nonzero(contacts, axis=1)
+                        return _split_rows(cols.tolist(), counts.tolist())
                     return [np.nonzero(c)[0].tolist() for c in contacts]
                 elif not is_complex:  # integer dtype: assume indices
                     return contacts.tolist()
@@ -167,24 +298,19 @@ class SimViewBodyState:
                 raise ValueError("Unknown contact format")
 
     def to_json(self):
-        # Merge position and orientation into bodyTransform
-        # position: [x, y, z] or [[x, y, z], ...]
-        # orientation: [w, x, y, z] or [[w, x, y, z], ...]
-        if len(self.position) > 0 and isinstance(self.position[0], list):
-            # Batched
-            body_transform = [p + o for p, o in zip(self.position, self.orientation)]
-        else:
-            # Single
-            body_transform = self.position + self.orientation
-
-        fields = {"bodyTransform": body_transform, **self.optional_attrs}
-        if self.binary:
-            fields = {
+        # Python floats are only built (by .tolist()) for fields that end up
+        # as plain JSON lists; blobs are packed straight from the arrays.
+        fields = {"bodyTransform": self.body_transform, **self.optional_attrs}
+        return {
+            "name": self.body_name,
+            **{
                 key: (
-                    _encode_blob(np.array(value, dtype=np.float32))
-                    if key in _BINARY_ELIGIBLE_FIELDS
+                    _encode_blob(value)
+                    if self.binary and key in _BINARY_ELIGIBLE_FIELDS
+                    else value.tolist()
+                    if isinstance(value, np.ndarray)
                     else value
                 )
                 for key, value in fields.items()
-            }
-        return {"name": self.body_name, **fields}
+            },
+        }
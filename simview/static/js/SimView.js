@@ -177,11 +177,20 @@ export class SimView {
         };
         collect(obj);
 
+        // The server gives byte-identical blobs the same URL, so fetch each
+        // URL once. Every reference after the first gets its own copy of the
+        // buffer, so decoded arrays never alias across containers.
+        const buffers = new Map();
+        const claimed = new Set();
         await Promise.all(
             refs.map(async ({ container, key, url }) => {
-                const res = await fetch(url);
-                const arrayBuffer = await res.arrayBuffer();
-                container[key] = SimView.decodeFloat32Blob(arrayBuffer);
+                if (!buffers.has(url)) {
+                    buffers.set(url, fetch(url).then((res) => res.arrayBuffer()));
+                }
+                const arrayBuffer = await buffers.get(url);
+                const owned = claimed.has(url) ? arrayBuffer.slice(0) : arrayBuffer;
+                claimed.add(url);
+                container[key] = SimView.decodeFloat32Blob(owned);
             })
         );
     }
@@ -9,6 +9,16 @@ import {
 
 export class StaticObject {
     constructor(objectData, app) {
+        // A batched object whose batches repeat the same shape ships each
+        // distinct shape once plus a per-batch index into them (see
+        // SimViewStaticObject.to_json); expand that back to one shape per batch.
+        if (!objectData.shapes && Array.isArray(objectData.shapeIndices)) {
+            const uniqueShapes = objectData.uniqueShapes || [];
+            objectData = {
+                ...objectData,
+                shapes: objectData.shapeIndices.map((i) => uniqueShapes[i]),
+            };
+        }
         this.app = app;
         this.name = objectData.name;
         this.isSingleton = objectData.isSingleton || false; // Default to false if not specified
@@ -27,7 +37,8 @@ export class StaticObject {
         } else {
             if (
                 !Array.isArray(objectData.shapes) ||
-                objectData.shapes.length !== this.batchSize
+                objectData.shapes.length !== this.batchSize ||
+                objectData.shapes.some((shape) => !shape)
             ) {
                 throw new Error(
                     `Batched static object requires a 'shapes' array of length ${this.batchSize}.`
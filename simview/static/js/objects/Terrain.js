@@ -9,8 +9,9 @@ export class Terrain {
         this.dimensions = terrainData.dimensions;
         this.group = null;
 
-        this.heightData = this.#normalizeScalarField(terrainData.heightData, true);
         this.isSingleton = terrainData.isSingleton;
+        this.dataBatches = this.#countDataBatches(terrainData.heightData);
+        this.heightData = this.#normalizeScalarField(terrainData.heightData, true);
         this.#initProperties(terrainData.properties);
         this.#initEmbeddingData(terrainData.embeddingData);
 
@@ -19,6 +20,26 @@ export class Terrain {
         this.#createVisualRepresentations(this.heightData, normals);
     }
 
+    // Number of per-batch copies the terrain arrays actually carry. A
+    // singleton terrain is stored once (see SimViewModel.create_terrain), so
+    // its blobs hold a single batch regardless of simBatches; files written
+    // before that change repeat the shared grid once per batch, so infer it
+    // from heightData's length rather than assuming either layout.
+    #countDataBatches(heightData) {
+        const simBatches = this.app.batchManager.simBatches;
+        if (!this.isSingleton) {
+            return simBatches;
+        }
+        if (heightData instanceof Float32Array) {
+            const resolution = this.dimensions.resolutionX * this.dimensions.resolutionY;
+            return heightData.length === resolution ? 1 : simBatches;
+        }
+        if (Array.isArray(heightData) && Array.isArray(heightData[0])) {
+            return heightData.length;
+        }
+        return 1;
+    }
+
     // Reserved color-mode names a property can't be named after -- picking
     // one of these would make getAvailableColorModes/#updateSurfaceColor
     // ambiguous between the built-in mode and the named property.
@@ -57,8 +78,7 @@ export class Terrain {
     #initEmbeddingData(embeddingData) {
         const resolution = this.dimensions.resolutionX * this.dimensions.resolutionY;
         if (embeddingData instanceof Float32Array) {
-            const batchSize = this.app.batchManager.simBatches;
-            this.embeddingDim = embeddingData.length / (batchSize * resolution);
+            this.embeddingDim = embeddingData.length / (this.dataBatches * resolution);
             this.embeddingData = this.#splitIntoBatches(embeddingData, this.embeddingDim);
         } else if (
             Array.isArray(embeddingData) &&
@@ -73,10 +93,10 @@ export class Terrain {
         }
     }
 
-    // Reshapes a flat Float32Array of `batchSize` concatenated per-vertex
+    // Reshapes a flat Float32Array of `dataBatches` concatenated per-vertex
     // records (`width` floats each) into one subarray view per batch.
     #splitIntoBatches(flatArray, width) {
-        const batchSize = this.app.batchManager.simBatches;
+        const batchSize = this.dataBatches;
         const resolution = this.dimensions.resolutionX * this.dimensions.resolutionY;
         const perBatch = resolution * width;
         const batches = [];
@@ -2,9 +2,9 @@
 trajectory) for `simview terrain`.
 
 Deliberately dependency-free (stdlib only: json, base64, struct, math) so
-it works on a base install without the `authoring` extra (torch/einops/
-numpy) -- see CLAUDE.md and `simview/info.py`'s module docstring for the
-same rationale. Kept as a separate module from `simview/info.py` on
+it works on a base install without the `authoring` extra (torch/numpy)
+-- see CLAUDE.md and `simview/info.py`'s module docstring for the same
+rationale. Kept as a separate module from `simview/info.py` on
 purpose, even though both read the same wire format, to keep the two
 debugging tools independently reviewable.
 
@@ -131,10 +131,12 @@ def _decode_grid(
 ) -> list[list[float]]:
     """Decode one terrain field into `batch_idx`'s `(shape_y, shape_x)` grid.
 
-    Handles both wire variants: a blob (always broadcast to all
-    `batch_size` batches by `SimViewTerrain.create()`) and a plain nested
-    list (which the dataclass's type hint describes as a single 2D grid
-    shared across all batches, with no batch dimension) -- see the
+    Handles both wire variants: a blob and a plain nested list (which the
+    dataclass's type hint describes as a single 2D grid shared across all
+    batches, with no batch dimension). `SimViewTerrain.create()` stores a
+    blob once when the terrain is shared by every batch (`is_singleton`)
+    and per batch otherwise; files from older versions always repeat it for
+    all `batch_size` batches. Either length is accepted -- see the
     `simview/model.py` `SimViewTerrain.create`/`create_terrain` comments.
     """
     if not (0 <= batch_idx < batch_size):
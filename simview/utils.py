@@ -1,6 +1,7 @@
 import gzip
 import socket
 from pathlib import Path
+from typing import IO
 
 # gzip magic bytes (RFC 1952): every gzip member starts with these two bytes,
 # regardless of the file extension used on disk.
@@ -27,6 +28,19 @@ def find_free_port(host: str, base_port: int) -> int:
     raise OSError(f"No free port found on {host} in range [{base_port}, {_MAX_PORT}].")
 
 
+def is_gzipped(f: IO[bytes]) -> bool:
+    """Return whether the open binary file `f` starts with the gzip magic bytes.
+
+    Checks from the start of the file and leaves the file position unchanged.
+    """
+    pos = f.tell()
+    f.seek(0)
+    try:
+        return f.read(2) == _GZIP_MAGIC
+    finally:
+        f.seek(pos)
+
+
 def read_maybe_gzipped_bytes(path: str | Path) -> bytes:
     """Read `path` and transparently gunzip it if it's gzip-compressed.
 
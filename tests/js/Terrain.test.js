@@ -37,9 +37,10 @@ function fakeApp(simBatches = 2) {
 }
 
 function makeTerrainData(isSingleton = false) {
-    // A real singleton terrain's wire data is the *same* values broadcast to
-    // every batch (see model.py's `SimViewTerrain.create` repeat()), so a
-    // singleton fixture must use identical per-batch chunks -- unlike the
+    // This is the older singleton wire layout -- the *same* values repeated
+    // once per batch -- which the viewer still accepts (current files store
+    // a singleton once, see makeStoredOnceSingleton below), so a singleton
+    // fixture must use identical per-batch chunks -- unlike the
     // non-singleton fixture below, which deliberately differs so diff/probe
     // math has something to detect.
     const frictionB = isSingleton ? FRICTION_A : FRICTION_B;
@@ -63,6 +64,25 @@ function makeTerrainData(isSingleton = false) {
     };
 }
 
+// A singleton terrain as SimViewModel.create_terrain writes it now: one copy
+// of each grid, broadcast to every batch by the viewer.
+function makeStoredOnceSingleton() {
+    return {
+        bounds: { minX: 0, maxX: 1, minY: 0, maxY: 1, minZ: 0, maxZ: 3 },
+        dimensions: { sizeX: 1, sizeY: 1, resolutionX: RESOLUTION, resolutionY: RESOLUTION },
+        heightData: new Float32Array(HEIGHT_A),
+        properties: {
+            friction: { data: new Float32Array(FRICTION_A), min: 0.3, max: 0.9 },
+        },
+        normals: new Float32Array(
+            Array(RESOLUTION * RESOLUTION * 3)
+                .fill(0)
+                .map((_, i) => (i % 3 === 2 ? 1 : 0))
+        ),
+        isSingleton: true,
+    };
+}
+
 describe("Terrain.getPropertiesAt / getPropertiesAtAllBatches", () => {
     let app, terrain;
 
@@ -132,3 +152,18 @@ describe("Terrain diff overlay helpers", () => {
         expect(terrain.getDiffMaxAbsDelta()).toBe(0);
     });
 });
+
+describe("Terrain singleton stored once", () => {
+    it("reads the single stored copy for every batch", () => {
+        const terrain = new Terrain(makeStoredOnceSingleton(), fakeApp(2));
+        expect(terrain.dataBatches).toBe(1);
+        const all = terrain.getPropertiesAtAllBatches(10, 1, 1);
+        expect(all.get(0).friction).toBeCloseTo(0.3);
+        expect(all.get(1).friction).toBeCloseTo(0.3);
+    });
+
+    it("still accepts the older layout with the grid repeated per batch", () => {
+        const terrain = new Terrain(makeTerrainData(true), fakeApp(2));
+        expect(terrain.dataBatches).toBe(2);
+    });
+});
@@ -12,6 +12,14 @@ def test_contacts_from_mask(dtype):
     assert SimViewBodyState._process_contacts(mask) == [[0, 2], []]
 
 
+@pytest.mark.parametrize("as_numpy", [False, True])
+def test_contacts_from_mask_matches_per_row_nonzero(as_numpy):
+    mask = torch.rand(5, 8, generator=torch.Generator().manual_seed(0)) > 0.6
+    expected = [torch.nonzero(row, as_tuple=True)[0].tolist() for row in mask]
+    value = mask.numpy() if as_numpy else mask
+    assert SimViewBodyState._process_contacts(value) == expected
+
+
 @pytest.mark.parametrize("dtype", [torch.int32, torch.int64])
 def test_contacts_from_indices(dtype):
     idx = torch.tensor([[0, 2], [1, 1]], dtype=dtype)
@@ -3,6 +3,7 @@ swallowed -- the caller should learn the server crashed, while cleanup and
 KeyboardInterrupt handling stay graceful)."""
 
 import logging
+import weakref
 
 import pytest
 
@@ -80,6 +81,28 @@ def test_launch_passes_in_memory_scene_data_to_server(monkeypatch):
     assert received["data"]["states"] == expected_states
 
 
+def test_launch_releases_server_before_cleanup_collects(monkeypatch):
+    scene = build_scene(batch_size=1)
+    launcher = SimViewLauncher(scene)
+
+    servers = []
+
+    class _FakeServer:
+        def __init__(self, data=None, sim_path=None):
+            self.data = data
+            self.cycle = self  # like the real server's app/route closures
+            servers.append(weakref.ref(self))
+
+        def run(self, host, port):
+            pass
+
+    monkeypatch.setattr(launcher_module, "SimViewServer", _FakeServer)
+
+    launcher.launch()
+
+    assert servers[0]() is None
+
+
 def test_launch_with_file_path_does_not_construct_data_kwarg(monkeypatch, tmp_path):
     scene = build_scene(batch_size=1)
     sim_file = tmp_path / "sim.json"
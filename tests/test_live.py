@@ -109,8 +109,8 @@ def test_broadcast_drops_dead_connection_without_raising(live_client):
 # --- Full integration: real background thread + real socket -----------------
 
 
-def build_minimal_scene() -> SimulationScene:
-    scene = SimulationScene(batch_size=1, scalar_names=[], dt=0.1)
+def build_minimal_scene(scalar_names=()) -> SimulationScene:
+    scene = SimulationScene(batch_size=1, scalar_names=list(scalar_names), dt=0.1)
     resolution = 4
     heights = torch.zeros(resolution, resolution)
     normals = torch.zeros(3, resolution, resolution)
@@ -156,3 +156,30 @@ def test_live_viewer_stop_is_idempotent():
     live = LiveViewer(scene, preferred_port=5997, open_browser=False)
     live.stop()
     live.stop()  # must not raise
+
+
+def test_live_viewer_push_state_inside_open_stream(tmp_path):
+    scene = build_minimal_scene()
+    pos = torch.tensor([[0.0, 0.0, 1.0]])
+    quat = torch.tensor([[1.0, 0.0, 0.0, 0.0]])
+    with LiveViewer(scene, preferred_port=5996, open_browser=False) as live:
+        with scene.open_stream(tmp_path / "live.json") as path:
+            live.push_state(0.0, [SimViewBodyState("Box", pos, quat)])
+            live.push_state(0.1, [SimViewBodyState("Box", pos, quat)])
+        # Streamed frames are still broadcast, just not kept in the scene.
+        assert [f["time"] for f in live.server.frame_buffer] == [0.0, 0.1]
+        assert scene.states == []
+
+    loaded = SimulationScene.load(path)
+    assert [s["time"] for s in loaded.states] == [0.0, 0.1]
+
+
+def test_live_viewer_pushed_frame_includes_tensor_scalars():
+    scene = build_minimal_scene(scalar_names=["energy"])
+    pos = torch.tensor([[0.0, 0.0, 1.0]])
+    quat = torch.tensor([[1.0, 0.0, 0.0, 0.0]])
+    with LiveViewer(scene, preferred_port=5995, open_browser=False) as live:
+        live.push_state(
+            0.0, [SimViewBodyState("Box", pos, quat)], {"energy": torch.ones(1)}
+        )
+        assert live.server.frame_buffer[0]["energy"] == [1.0]
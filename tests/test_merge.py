@@ -19,6 +19,12 @@ def _decode_blob(value: str) -> list[float]:
     return list(struct.unpack(f"<{len(raw) // 4}f", raw))
 
 
+def _repeat_blob(value: str, n: int) -> str:
+    """Concatenate a __b64__ blob's payload with itself `n` times."""
+    raw = base64.b64decode(value[7:])
+    return "__b64__" + base64.b64encode(raw * n).decode("utf-8")
+
+
 def _decode_blob_per_batch(value: str, batch_size: int) -> list[list[float]]:
     """Decode a terrain __b64__ blob into the plain-list shape merge.py
     expects: one entry per batch, each a flat list of floats."""
@@ -53,6 +59,24 @@ def build_custom_scene(
     return scene
 
 
+def test_merge_expands_deduplicated_static_object_shapes(tmp_path):
+    box = {"hx": 0.5, "hy": 0.5, "hz": 0.5}
+    big = {"hx": 1.0, "hy": 1.0, "hz": 1.0}
+    scene_a = build_scene(batch_size=1)
+    scene_a.create_static_object_batched("Crates", BodyShapeType.BOX, [big])
+    scene_b = build_scene(batch_size=2)
+    scene_b.create_static_object_batched("Crates", BodyShapeType.BOX, [box, box])
+    path_a, path_b = tmp_path / "a.json", tmp_path / "b.json"
+    scene_a.save(path_a)
+    scene_b.save(path_b)
+    assert "uniqueShapes" in json.loads(path_b.read_text())["model"]["staticObjects"][0]
+
+    merged = merge_simulation_files([path_a, path_b])
+
+    (crates,) = merged["model"]["staticObjects"]
+    assert [shape["hx"] for shape in crates["shapes"]] == [1.0, 0.5, 0.5]
+
+
 def test_merge_concatenates_batches(tmp_path):
     scene_a = build_scene(batch_size=1)
     scene_b = build_scene(batch_size=2)
@@ -548,10 +572,9 @@ def test_merge_binary_normals_grouped_into_vec3_per_batch(tmp_path):
 
 
 def test_merge_terrain_already_broadcast_singleton(tmp_path):
-    """SimViewModel.create_terrain, when batch_size > 1 and every terrain field
-    is shared (batch dim 1), sets isSingleton=True but still broadcasts the
-    encoded data out to batch_size rows (the viewer always splits terrain into
-    batch_size chunks). `_expand_batched`'s b64 singleton branch used to assume
+    """Files saved before singleton terrain was stored unbroadcast have
+    isSingleton=True but their encoded data already broadcast out to
+    batch_size rows. `_expand_batched`'s b64 singleton branch used to assume
     isSingleton=True + batch_size>1 always means "one row, needs broadcasting",
     and blindly repeated the blob batch_size times -- corrupting this
     already-fully-replicated case into batch_size^2 rows crammed into
@@ -568,15 +591,19 @@ def test_merge_terrain_already_broadcast_singleton(tmp_path):
     )[0]
 
     # build_scene(batch_size=2) shares terrain across both batches, so
-    # create_terrain marks it isSingleton=True but broadcasts heightData/
-    # normals to 2 rows before encoding -- exactly the trigger case.
+    # create_terrain marks it isSingleton=True and stores one row; replicate
+    # it to 2 rows by hand to recreate the older, already-broadcast layout.
     scene_b = build_scene(batch_size=2)
     path_b_bin = tmp_path / "b_bin.json"
     scene_b.save(path_b_bin)
     data_b_bin = json.loads(path_b_bin.read_text())
     terrain_b_bin = data_b_bin["model"]["terrain"]
     assert terrain_b_bin["isSingleton"] is True
-    assert isinstance(terrain_b_bin["heightData"], str)
+    for key in ("heightData", "normals"):
+        terrain_b_bin[key] = _repeat_blob(terrain_b_bin[key], 2)
+    for prop in terrain_b_bin["properties"].values():
+        prop["data"] = _repeat_blob(prop["data"], 2)
+    path_b_bin.write_text(json.dumps(data_b_bin))
     flat = _decode_blob(terrain_b_bin["heightData"])
     assert len(flat) == 2 * row_width  # already broadcast to both batches
 
@@ -600,3 +627,26 @@ def test_merge_terrain_already_broadcast_singleton(tmp_path):
         assert height[0] == pytest.approx(expected_row)
         assert height[1] == pytest.approx(expected_row)
         assert height[2] == pytest.approx(expected_row)
+
+
+def test_merge_terrain_singleton_stored_once_is_broadcast(tmp_path):
+    resolution = 4
+    row_width = resolution * resolution
+    scene_a = build_scene(batch_size=1)
+    path_a = tmp_path / "a.json"
+    scene_a.save(path_a)
+    scene_b = build_scene(batch_size=2)
+    path_b = tmp_path / "b.json"
+    scene_b.save(path_b)
+    terrain_b = json.loads(path_b.read_text())["model"]["terrain"]
+    assert terrain_b["isSingleton"] is True
+    assert len(_decode_blob(terrain_b["heightData"])) == row_width  # one copy
+
+    merged = merge_simulation_files([path_a, path_b])
+    terrain = merged["model"]["terrain"]
+    assert len(terrain["heightData"]) == 3
+    assert all(len(row) == row_width for row in terrain["heightData"])
+    assert len(terrain["normals"]) == 3
+    assert all(len(row) == row_width for row in terrain["normals"])
+    friction = terrain["properties"]["friction"]["data"]
+    assert friction == [[0.5] * row_width] * 3
@@ -54,6 +54,14 @@ def test_create_pointcloud_color_and_embedding_roundtrip():
     assert decoded_embedding == pytest.approx(embedding.flatten().tolist())
 
 
+def test_create_mesh_accepts_numpy_and_grad_tensors_as_blobs():
+    vertices = torch.arange(12, dtype=torch.float32).reshape(4, 3).requires_grad_()
+    faces = torch.tensor([[0, 1, 2], [0, 2, 3]]).numpy()
+    body = SimViewBody.create_mesh("mesh", vertices, faces)
+    assert _flat(body.shape["vertices"]) == pytest.approx(range(12))
+    assert _flat(body.shape["faces"]) == [0, 1, 2, 0, 2, 3]
+
+
 def test_create_pointcloud_without_color_or_embedding_omits_keys():
     body = SimViewBody.create_pointcloud("pts", torch.zeros(4, 3))
     assert "color" not in body.shape
@@ -112,7 +120,7 @@ def test_create_terrain_embedding_map_batch_dim_validation():
         )
 
 
-def test_create_terrain_embedding_map_broadcasts_shared_batch():
+def test_create_terrain_embedding_map_shared_batch_stored_once():
     res, K, B = 3, 2, 3
     scene = SimulationScene(batch_size=B, scalar_names=[], dt=0.1)
     heights = torch.zeros(1, res, res)
@@ -123,8 +131,9 @@ def test_create_terrain_embedding_map_broadcasts_shared_batch():
     terrain = scene.model.terrain
     assert terrain is not None
     assert isinstance(terrain.embedding_data, str)
+    assert terrain.is_singleton is True
     decoded = _flat(terrain.embedding_data)
-    assert len(decoded) == B * res * res * K
+    assert len(decoded) == res * res * K
 
 
 def test_create_terrain_without_embedding_map_key_is_none():
@@ -19,7 +19,7 @@ from simview.model import (
     _encode_blob,
 )
 from simview.scene import SimulationScene
-from simview.state import BodyTrajectory
+from simview.state import BodyTrajectory, SimViewBodyState
 
 
 def test_save_produces_loadable_json(tmp_path):
@@ -70,6 +70,21 @@ def test_states_shape(tmp_path):
     assert len(_decode_blob(box["velocity"])) == 2 * 3
 
 
+def test_save_serializes_numpy_values_and_int_keys_in_metadata(tmp_path):
+    np = pytest.importorskip("numpy")
+    scene = build_scene(batch_size=2)
+    scene.model.metadata = {
+        "seed": np.int64(7),
+        "gains": np.array([0.5, 1.5]),
+        "per_step": {10: "warmup"},
+    }
+    out = tmp_path / "sim.json"
+    scene.save(out)
+
+    metadata = json.loads(out.read_text())["model"]["metadata"]
+    assert metadata == {"seed": 7, "gains": [0.5, 1.5], "per_step": {"10": "warmup"}}
+
+
 def test_decode_blob_reverses_encode_blob():
     import numpy as np
 
@@ -126,6 +141,17 @@ def test_body_to_json_from_dict_roundtrip():
     assert "localTransform" not in body.to_json()
 
 
+def test_body_shape_scalars_from_tensors_and_numpy_are_python_numbers():
+    import numpy as np
+
+    body = SimViewBody.create(
+        "Box", BodyShapeType.BOX, hx=torch.tensor(0.5), hy=np.float32(0.25), hz=1
+    )
+    assert body.shape == {"type": "box", "hx": 0.5, "hy": 0.25, "hz": 1}
+    assert all(type(body.shape[k]) in (float, int) for k in ("hx", "hy", "hz"))
+    json.dumps(body.to_json())
+
+
 def test_body_with_parent_to_json_from_dict_roundtrip():
     # parent/local_transform pass through create_box's **kwargs by keyword
     # name to SimViewBody.create's explicit params, same as create_body.
@@ -160,6 +186,42 @@ def test_static_object_to_json_from_dict_roundtrip():
     assert restored_batched == batched
 
 
+def test_batched_static_object_writes_repeated_shapes_once():
+    box = {"hx": 0.5, "hy": 0.5, "hz": 0.5}
+    batched = SimViewStaticObject.create_batched(
+        "Crates", BodyShapeType.BOX, [box, {"hx": 1.0, "hy": 1.0, "hz": 1.0}, box]
+    )
+    d = batched.to_json()
+    assert "shapes" not in d
+    assert len(d["uniqueShapes"]) == 2
+    assert d["shapeIndices"] == [0, 1, 0]
+    assert SimViewStaticObject.from_dict(d) == batched
+
+
+def test_batched_static_object_keeps_distinct_large_arrays_apart():
+    import numpy as np
+
+    # numpy truncates the repr of large arrays, so these two print identically.
+    a = np.zeros(2000)
+    b = np.zeros(2000)
+    b[1000] = 1.0
+    shapes = [{"type": "mesh", "vertices": a}, {"type": "mesh", "vertices": b}]
+    d = SimViewStaticObject(name="Rocks", is_singleton=False, shapes=shapes).to_json()
+    assert "uniqueShapes" not in d
+    assert d["shapes"] is shapes
+
+
+def test_batched_static_object_invalid_shape_index_raises():
+    d = {
+        "name": "Crates",
+        "isSingleton": False,
+        "uniqueShapes": [{"type": "box", "hx": 1.0, "hy": 1.0, "hz": 1.0}],
+        "shapeIndices": [0, 1],
+    }
+    with pytest.raises(ValueError, match="invalid shapeIndices"):
+        SimViewStaticObject.from_dict(d)
+
+
 def test_model_to_json_from_dict_roundtrip():
     scene = build_scene(batch_size=2)
     model = scene.model
@@ -264,6 +326,175 @@ def test_scene_save_load_save_equivalence_with_binary_trajectory(tmp_path):
     assert body0["bodyTransform"].startswith("__b64__")
 
 
+def _box_state(z: float, batch_size: int, **attrs) -> SimViewBodyState:
+    pos = torch.tensor([[0.0, 0.0, z]] * batch_size)
+    quat = torch.tensor([[1.0, 0.0, 0.0, 0.0]] * batch_size)
+    return SimViewBodyState("Box", pos, quat, attrs or None)
+
+
+def test_body_state_to_json_matches_tensor_tolist():
+    import numpy as np
+
+    pos = torch.tensor([[0.1, 0.2, 0.3], [1.0, 2.0, 3.0]], dtype=torch.float64)
+    quat = torch.tensor([[1.0, 0.0, 0.0, 0.0]] * 2, requires_grad=True)
+    vel = np.array([[0.5, 0.0, 0.0], [0.0, 0.5, 0.0]])
+    expected = [p + q for p, q in zip(pos.tolist(), quat.tolist())]
+
+    plain = SimViewBodyState("Box", pos, quat, {"velocity": vel}, binary=False)
+    assert plain.to_json() == {
+        "name": "Box",
+        "bodyTransform": expected,
+        "velocity": vel.tolist(),
+    }
+    single = SimViewBodyState("Box", pos[0], quat[0], binary=False)
+    assert single.to_json()["bodyTransform"] == expected[0]
+
+    packed = SimViewBodyState("Box", pos, quat, {"velocity": vel}).to_json()
+    assert _decode_blob(packed["bodyTransform"]) == pytest.approx(sum(expected, []))
+    assert _decode_blob(packed["velocity"]) == pytest.approx(vel.flatten().tolist())
+
+
+def test_body_state_accepts_list_of_per_batch_vectors():
+    pos = torch.zeros(2, 3)
+    quat = torch.tensor([[1.0, 0.0, 0.0, 0.0]] * 2)
+    rows = [torch.tensor([1.0, 2.0, 3.0]), torch.tensor([4.0, 5.0, 6.0])]
+
+    state = SimViewBodyState("Box", pos, quat, {"force": rows}, binary=False)
+    assert state.to_json()["force"] == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    packed = SimViewBodyState("Box", pos, quat, {"force": rows}).to_json()
+    assert _decode_blob(packed["force"]) == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+def test_body_state_accepts_bfloat16_tensors():
+    pos = torch.tensor([[0.0, 1.0, 2.0]] * 2, dtype=torch.bfloat16)
+    quat = torch.tensor([[1.0, 0.0, 0.0, 0.0]] * 2, dtype=torch.bfloat16)
+    vel = torch.ones(2, 3, dtype=torch.bfloat16)
+
+    state = SimViewBodyState("Box", pos, quat, {"velocity": vel}, binary=False)
+    assert state.to_json()["bodyTransform"] == [[0.0, 1.0, 2.0, 1.0, 0.0, 0.0, 0.0]] * 2
+    assert state.to_json()["velocity"] == vel.tolist()
+    rows = SimViewBodyState("Box", pos, quat, {"force": list(vel)}, binary=False)
+    assert rows.to_json()["force"] == vel.tolist()
+    (framed,) = SimViewBodyState.from_frame(
+        ["Box"], pos[None], quat[None], {"velocity": vel[None]}, binary=False
+    )
+    assert framed.to_json() == state.to_json()
+
+
+def test_body_state_snapshots_caller_buffers():
+    # A sim that updates its buffers in place each step must still record
+    # each step's values, not the last step's.
+    import numpy as np
+
+    vel = torch.zeros(2, 3)
+    frame_vel = np.zeros((1, 2, 3))
+    state = SimViewBodyState(
+        "Box", torch.zeros(2, 3), torch.zeros(2, 4), {"velocity": vel}, binary=False
+    )
+    (framed,) = SimViewBodyState.from_frame(
+        ["Box"],
+        np.zeros((1, 2, 3)),
+        np.zeros((1, 2, 4)),
+        {"velocity": frame_vel},
+        binary=False,
+    )
+    vel += 5
+    frame_vel += 5
+    assert state.to_json()["velocity"] == [[0.0, 0.0, 0.0]] * 2
+    assert framed.to_json()["velocity"] == [[0.0, 0.0, 0.0]] * 2
+
+
+def test_body_state_from_frame_matches_per_body_states():
+    pos = torch.arange(2 * 2 * 3, dtype=torch.float32).reshape(2, 2, 3)
+    quat = torch.tensor([[1.0, 0.0, 0.0, 0.0]] * 4).reshape(2, 2, 4)
+    vel = torch.ones(2, 2, 3)
+    contacts = torch.tensor([[[1, 0], [0, 1]], [[0, 0], [1, 1]]], dtype=torch.bool)
+    attrs = {"velocity": vel, "contacts": contacts}
+
+    states = SimViewBodyState.from_frame(["Box", "Box2"], pos, quat, attrs)
+    expected = [
+        SimViewBodyState(
+            name, pos[i], quat[i], {"velocity": vel[i], "contacts": contacts[i]}
+        )
+        for i, name in enumerate(["Box", "Box2"])
+    ]
+    assert [s.to_json() for s in states] == [s.to_json() for s in expected]
+
+
+def test_body_state_from_frame_rejects_wrong_row_count():
+    with pytest.raises(ValueError, match="'velocity'.*leading dimension of 2"):
+        SimViewBodyState.from_frame(
+            ["Box", "Box2"],
+            torch.zeros(2, 3),
+            torch.zeros(2, 4),
+            {"velocity": torch.zeros(3, 3)},
+        )
+
+
+def test_body_state_rejects_mismatched_pose_batches():
+    with pytest.raises(ValueError):
+        SimViewBodyState("Box", torch.zeros(2, 3), torch.zeros(3, 4))
+
+
+def test_open_stream_writes_same_scene_as_save(tmp_path):
+    saved, streamed = build_scene(batch_size=2), build_scene(batch_size=2)
+    extra = {"force": torch.ones(2, 3)}
+    saved.add_state(0.3, [_box_state(3.0, 2, **extra)], {"energy": torch.ones(2)})
+    saved.save(tmp_path / "saved.json")
+
+    # Frames recorded before the stream opened are written first.
+    with streamed.open_stream(tmp_path / "streamed.json") as path:
+        streamed.add_state(
+            0.3, [_box_state(3.0, 2, **extra)], {"energy": torch.ones(2)}
+        )
+        assert streamed.states == []
+
+    assert path == tmp_path / "streamed.json"
+    a = json.loads((tmp_path / "saved.json").read_text())
+    b = json.loads(path.read_text())
+    assert b == a
+    assert "force" in b["model"]["bodies"][0]["availableAttributes"]
+
+
+def test_open_stream_add_trajectory_and_gzip(tmp_path):
+    scene = build_scene(batch_size=1)
+    scene.states = []
+    with scene.open_stream(tmp_path / "run.json", compress=True) as path:
+        scene.add_trajectory(
+            [0.0, 0.1],
+            [
+                BodyTrajectory(
+                    "Box", torch.zeros(2, 3), torch.tensor([[1.0, 0, 0, 0]] * 2)
+                )
+            ],
+            {"energy": torch.zeros(2)},
+        )
+    assert path.name == "run.json.gz"
+    loaded = SimulationScene.load(path)
+    assert [s["time"] for s in loaded.states] == [0.0, 0.1]
+
+
+def test_open_stream_finalizes_file_when_block_raises(tmp_path):
+    scene = build_scene(batch_size=1)
+    with pytest.raises(RuntimeError, match="sim crashed"):
+        with scene.open_stream(tmp_path / "run.json"):
+            scene.add_state(1.0, [_box_state(1.0, 1)], {"energy": [0.0]})
+            raise RuntimeError("sim crashed")
+    loaded = SimulationScene.load(tmp_path / "run.json")
+    assert len(loaded.states) == 4
+    # Streaming stopped: later frames are kept in memory again.
+    scene.add_state(2.0, [_box_state(2.0, 1)], {"energy": [0.0]})
+    assert len(scene.states) == 1
+
+
+def test_open_stream_twice_raises(tmp_path):
+    scene = build_scene(batch_size=1)
+    with scene.open_stream(tmp_path / "a.json"):
+        with pytest.raises(RuntimeError, match="already open"):
+            with scene.open_stream(tmp_path / "b.json"):
+                pass
+
+
 # --- Gzip support (gameplan item 16) ----------------------------------------
 
 
@@ -336,6 +567,37 @@ def test_scene_from_dict_matches_original_model():
     assert loaded.states == scene.states
 
 
+def test_terrain_create_accepts_tensors_requiring_grad():
+    heightmap = torch.arange(8.0).reshape(1, 2, 4).requires_grad_()
+    normals = torch.zeros(1, 3, 2, 4, requires_grad=True)
+    friction = torch.full((1, 2, 4), 0.5, requires_grad=True)
+    terrain = SimViewTerrain.create(
+        heightmap=heightmap,
+        normals=normals,
+        x_lim=(-1, 1),
+        y_lim=(-1, 1),
+        is_singleton=False,
+        properties={"friction": friction},
+    )
+    assert (terrain.min_z, terrain.max_z) == (0.0, 7.0)
+    assert _decode_blob(terrain.height_data) == [float(v) for v in range(8)]
+    assert (terrain.properties["friction"].min, terrain.properties["friction"].max) == (
+        0.5,
+        0.5,
+    )
+
+
+def test_create_terrain_float64_grad_heightmap_with_default_normals():
+    scene = SimulationScene(batch_size=1, scalar_names=[], dt=0.1)
+    heightmap = torch.arange(8.0, dtype=torch.float64).reshape(2, 4).requires_grad_()
+    scene.create_terrain(heightmap, x_lim=(-1, 1), y_lim=(-1, 1))
+    terrain = scene.model.terrain
+    assert terrain is not None
+    assert _decode_blob(terrain.height_data) == [float(v) for v in range(8)]
+    assert len(_decode_blob(terrain.normals)) == 8 * 3
+    assert heightmap.grad is None
+
+
 def test_invalid_heightmap_ndim_raises_value_error():
     resolution = 4
     # SimViewTerrain.create requires an explicit batch dimension (ndim == 3);
@@ -467,3 +467,78 @@ def test_scene_metadata_set_after_construction_reaches_to_json():
 def test_scene_default_metadata_is_none():
     scene = _base_scene(batch_size=1)
     assert scene.model.metadata is None
+
+
+# --- Scalar conversion in add_state ------------------------------------------
+
+
+def _identity_pose_state(batch_size: int) -> SimViewBodyState:
+    quat = torch.zeros(batch_size, 4)
+    quat[..., 0] = 1.0
+    return SimViewBodyState("Box", torch.zeros(batch_size, 3), quat)
+
+
+def test_add_state_scalars_mixed_types_match_per_frame_lists():
+    scene = _base_scene(batch_size=2, scalar_names=["energy"])
+    values = [
+        torch.tensor([1.0, 2.0]),
+        np.array([3.0, 4.0], dtype=np.float32),
+        [5.0, 6.0],
+        torch.tensor([7, 8]),
+    ]
+    for t, value in enumerate(values):
+        scene.add_state(
+            time=t * 0.1,
+            body_states=[_identity_pose_state(2)],
+            scalar_values={"energy": value},
+        )
+    assert [s["energy"] for s in scene.states] == [
+        [1.0, 2.0],
+        [3.0, 4.0],
+        [5.0, 6.0],
+        [7, 8],
+    ]
+
+
+def test_add_state_frames_are_complete_in_a_held_states_list():
+    scene = _base_scene(batch_size=2, scalar_names=["e", "f", "g"])
+    held = scene.states
+    scene.add_state(
+        time=0.0,
+        body_states=[_identity_pose_state(2)],
+        scalar_values={
+            "e": torch.ones(2),
+            "f": np.zeros(2, dtype=np.float32),
+            "g": [2.0, 3.0],
+        },
+    )
+    assert held[-1] == {
+        "time": 0.0,
+        "bodies": held[-1]["bodies"],
+        "e": [1.0, 1.0],
+        "f": [0.0, 0.0],
+        "g": [2.0, 3.0],
+    }
+
+
+def test_add_state_scalar_buffer_reused_in_place_keeps_earlier_frames():
+    scene = _base_scene(batch_size=2, scalar_names=["energy"])
+    buffer = torch.zeros(2)
+    for t in range(3):
+        buffer.fill_(float(t))
+        scene.add_state(
+            time=t * 0.1,
+            body_states=[_identity_pose_state(2)],
+            scalar_values={"energy": buffer},
+        )
+    assert [s["energy"] for s in scene.states] == [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]]
+
+
+@pytest.mark.parametrize(
+    "scalar_values",
+    [{"energy": [1.0, 2.0]}, {"energy": [1.0, 2.0], "power": [0.0, 0.0], "x": [0]}],
+)
+def test_add_state_scalar_keys_mismatch_raises(scalar_values):
+    scene = _base_scene(batch_size=2, scalar_names=["energy", "power"])
+    with pytest.raises(ValueError, match="do not match scalar_names"):
+        scene.add_state(0.0, [_identity_pose_state(2)], scalar_values)
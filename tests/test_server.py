@@ -167,6 +167,22 @@ def test_serves_gzipped_scene_file(tmp_path):
     assert len(client.get("/states").json()["times"]) == 3
 
 
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_scene_json_plain_and_gzipped(tmp_path, monkeypatch, compress, use_orjson):
+    import simview.server as server_module
+
+    if not use_orjson:
+        monkeypatch.setattr(server_module, "orjson", None)
+    scene = build_scene(batch_size=2)
+    sim_file = tmp_path / ("sim.json.gz" if compress else "sim.json")
+    scene.save(sim_file, compress=compress)
+
+    data = server_module._load_scene_json(sim_file)
+    assert data["model"]["simBatches"] == 2
+    assert len(data["states"]) == 3
+
+
 # --- Server hardening (gameplan item 10 / bug B7) ----------------------------
 
 
@@ -225,6 +241,21 @@ def test_blob_response_carries_immutable_cache_control_header(client):
     assert "immutable" in resp.headers["cache-control"]
 
 
+def test_identical_blobs_share_one_url():
+    np = pytest.importorskip("numpy")
+    from simview.model import _encode_blob
+
+    same = _encode_blob(np.ones(6, dtype="<f4"))
+    other = _encode_blob(np.zeros(6, dtype="<f4"))
+    server = SimViewServer(
+        data={"model": {"simBatches": 1, "a": same, "b": [same, other]}, "states": []}
+    )
+    model = TestClient(server.app).get("/model").json()
+    assert model["a"] == model["b"][0]
+    assert model["b"][1] != model["a"]
+    assert len(server.blobs) == 2
+
+
 def test_blob_endpoint_404s_for_wrong_token(client):
     model = client.get("/model").json()
     blob_ref = model["terrain"]["heightData"]
@@ -234,6 +265,31 @@ def test_blob_endpoint_404s_for_wrong_token(client):
     assert resp.status_code == 404
 
 
+def test_index_page_is_rendered_once_per_base_url(tmp_path, monkeypatch):
+    sim_file = tmp_path / "sim.json"
+    build_scene(batch_size=2).save(sim_file)
+    server = SimViewServer(sim_path=sim_file)
+    render = server.templates.TemplateResponse
+    calls = []
+
+    def counting_render(*args, **kwargs):
+        calls.append(kwargs["request"].base_url)
+        return render(*args, **kwargs)
+
+    monkeypatch.setattr(server.templates, "TemplateResponse", counting_render)
+    client = TestClient(server.app)
+
+    first = client.get("/")
+    assert first.headers["content-type"].startswith("text/html")
+    assert client.get("/").text == first.text
+    assert "http://testserver/static/js/main.js?v=" in first.text
+    assert len(calls) == 1
+
+    other = client.get("/", headers={"host": "127.0.0.1:5420"})
+    assert "http://127.0.0.1:5420/static/js/main.js?v=" in other.text
+    assert len(calls) == 2
+
+
 def test_importmap_is_fully_vendored_offline(client):
     # The viewer must work with no internet access: every specifier in the
     # importmap on the served index page must resolve to a same-origin
@@ -11,6 +11,7 @@ torch = pytest.importorskip("torch")
 from fastapi.testclient import TestClient
 
 from simview.merge import merge_simulation_files
+from simview.model import normals_from_heightmap
 from simview.scene import BodyShapeType, SimulationScene
 from simview.server import SimViewServer
 from simview.state import SimViewBodyState
@@ -63,15 +64,17 @@ def _per_batch_scene(batch_size: int, offset: float = 0.0) -> SimulationScene:
     return scene
 
 
-def test_shared_terrain_is_singleton_and_broadcast():
+def test_shared_terrain_is_singleton_and_stored_once():
     terrain, res = _terrain(batch_size=3, h_batches=1, n_batches=1)
     assert terrain.is_singleton is True
-    # Broadcast to batch_size so the viewer (which splits by batch_size) is happy.
+    # Stored as a single shared batch; consumers broadcast it to every batch.
     # create_terrain always binary-encodes heightData/normals (see _encode_blob
     # in SimViewTerrain.create), so this is always the `str` blob form, never
     # the plain-list form the field's type also allows.
     assert isinstance(terrain.height_data, str)
-    assert len(_flat(terrain.height_data)) == 3 * res * res
+    assert len(_flat(terrain.height_data)) == res * res
+    assert isinstance(terrain.normals, str)
+    assert len(_flat(terrain.normals)) == res * res * 3
 
 
 def test_mixed_shared_and_per_batch_is_not_singleton():
@@ -162,3 +165,26 @@ def test_per_batch_terrain_served_by_server(tmp_path):
     # Consistent per-frame states get columnarized into the v4 payload (see
     # test_columnar_states.py) rather than served as a bare per-frame array.
     assert len(client.get("/states").json()["times"]) == 2
+
+
+def test_normals_from_heightmap_of_tilted_plane():
+    # z = 0.5 * x on a 0.1 grid: normal is (-0.5, 0, 1) normalized, everywhere.
+    xs = torch.arange(4, dtype=torch.float32) * 0.1
+    heights = (0.5 * xs).expand(3, 4)
+    normals = normals_from_heightmap(heights, res_x=0.1, res_y=0.1)
+    assert normals.shape == (3, 3, 4)
+    expected = torch.tensor([-0.5, 0.0, 1.0]) / (1.25**0.5)
+    assert torch.allclose(normals.permute(1, 2, 0), expected.expand(3, 4, 3), atol=1e-6)
+
+
+def test_create_terrain_defaults_normals_to_normals_from_heightmap():
+    scene = SimulationScene(batch_size=1, scalar_names=[], dt=0.1)
+    heights = torch.rand(1, 4, 5)
+    scene.create_terrain(heights, x_lim=(0.0, 1.0), y_lim=(0.0, 2.0))
+    expected = normals_from_heightmap(heights, res_x=1.0 / 5, res_y=2.0 / 4)
+    # Wire layout is (B, Dy, Dx, 3).
+    terrain = scene.model.terrain
+    assert terrain is not None and isinstance(terrain.normals, str)
+    assert _flat(terrain.normals) == pytest.approx(
+        expected.permute(0, 2, 3, 1).flatten().tolist()
+    )
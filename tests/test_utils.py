@@ -6,7 +6,7 @@ import socket
 
 import pytest
 
-from simview.utils import find_free_port, read_maybe_gzipped_bytes
+from simview.utils import find_free_port, is_gzipped, read_maybe_gzipped_bytes
 
 
 def test_read_maybe_gzipped_bytes_plain_json(tmp_path):
@@ -30,6 +30,19 @@ def test_read_maybe_gzipped_bytes_detects_by_magic_not_extension(tmp_path):
     assert read_maybe_gzipped_bytes(path) == payload
 
 
+def test_is_gzipped_checks_magic_and_keeps_position(tmp_path):
+    plain = tmp_path / "plain.json"
+    plain.write_text('{"a": 1}')
+    compressed = tmp_path / "no_gz_suffix.json"
+    compressed.write_bytes(gzip.compress(b'{"a": 1}'))
+    with open(plain, "rb") as f:
+        assert not is_gzipped(f)
+    with open(compressed, "rb") as f:
+        f.seek(3)
+        assert is_gzipped(f)
+        assert f.tell() == 3
+
+
 def test_find_free_port_returns_base_port_when_free():
     # Bind and release a port first to get one that's very likely free, without
     # hardcoding a port number that might already be in use on the test runner.